@@ -16,12 +16,12 @@ public actor ConfigService {
 
     /// Writes `.wtmux/config.json` into the given repo path, creating the directory if needed.
     public func writeConfig(_ config: ProjectConfig, forRepo repoPath: String) throws {
-        let dirURL = URL(fileURLWithPath: repoPath)
-            .appendingPathComponent(Self.configDir)
+        let dirURL = URL(filePath: repoPath, directoryHint: .isDirectory)
+            .appending(path: Self.configDir, directoryHint: .isDirectory)
 
         try FileManager.default.createDirectory(at: dirURL, withIntermediateDirectories: true)
 
-        let fileURL = dirURL.appendingPathComponent(Self.configFile)
+        let fileURL = dirURL.appending(path: Self.configFile, directoryHint: .notDirectory)
         let encoder = JSONEncoder()
         encoder.outputFormatting = [.prettyPrinted, .sortedKeys]
         let data = try encoder.encode(config)
@@ -32,32 +32,40 @@ public actor ConfigService {
     /// Returns `true` if `.wtmux` was newly added, `false` if already present.
     @discardableResult
     public func ensureGitignore(forRepo repoPath: String) throws -> Bool {
-        let gitignoreURL = URL(fileURLWithPath: repoPath)
-            .appendingPathComponent(".gitignore")
+        let gitignoreURL = URL(filePath: repoPath, directoryHint: .isDirectory)
+            .appending(path: ".gitignore", directoryHint: .notDirectory)
 
-        var contents = ""
-        if FileManager.default.fileExists(atPath: gitignoreURL.path) {
-            contents = try String(contentsOf: gitignoreURL, encoding: .utf8)
-        }
+        let exists = FileManager.default.fileExists(atPath: gitignoreURL.path)
+        let data = try exists ? Data(contentsOf: gitignoreURL) : Data()
 
-        let lines = contents.components(separatedBy: .newlines)
-        let alreadyPresent = lines.contains { line in
-            let trimmed = line.trimmingCharacters(in: .whitespaces)
-            return trimmed == ".wtmux" || trimmed == ".wtmux/"
+        // Byte search first; only split into lines when ".wtmux" appears somewhere
+        if data.range(of: Data(".wtmux".utf8)) != nil {
+            let lines = String(decoding: data, as: UTF8.self).components(separatedBy: .newlines)
+            let alreadyPresent = lines.contains { line in
+                let trimmed = line.trimmingCharacters(in: .whitespaces)
+                return trimmed == ".wtmux" || trimmed == ".wtmux/"
+            }
+            if alreadyPresent { return false }
         }
 
-        if !alreadyPresent {
-            let suffix = contents.hasSuffix("\n") ? "" : "\n"
-            contents += "\(suffix).wtmux\n"
-            try contents.write(to: gitignoreURL, atomically: true, encoding: .utf8)
+        let prefix = data.last == UInt8(ascii: "\n") ? "" : "\n"
+        let entry = Data("\(prefix).wtmux\n".utf8)
+        guard exists else {
+            try entry.write(to: gitignoreURL)
             return true
         }
-        return false
+
+        let handle = try FileHandle(forWritingTo: gitignoreURL)
+        defer { try? handle.close() }
+        try handle.seekToEnd()
+        try handle.write(contentsOf: entry)
+        return true
     }
 
+    /// Built from directory hints so no filesystem check is needed to classify each component.
     private func configFileURL(forRepo repoPath: String) -> URL {
-        URL(fileURLWithPath: repoPath)
-            .appendingPathComponent(Self.configDir)
-            .appendingPathComponent(Self.configFile)
+        URL(filePath: repoPath, directoryHint: .isDirectory)
+            .appending(path: Self.configDir, directoryHint: .isDirectory)
+            .appending(path: Self.configFile, directoryHint: .notDirectory)
     }
 }
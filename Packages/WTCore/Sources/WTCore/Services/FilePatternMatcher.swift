@@ -12,6 +12,7 @@ public enum FilePatternMatcher {
     public static func match(patterns: [String], in repoPath: String) -> [String] {
         let fm = FileManager.default
         var results: [String] = []
+        var seen: Set<String> = []
 
         for pattern in patterns {
             if pattern.contains("*") {
@@ -20,30 +21,23 @@ public enum FilePatternMatcher {
                 let parentDir = nsPattern.deletingLastPathComponent
                 let filePattern = nsPattern.lastPathComponent
 
+                // Prefix joined onto each matched name; computed once per pattern
                 let searchDir: String
+                let relativePrefix: String
                 if parentDir.isEmpty || parentDir == "." {
                     searchDir = repoPath
+                    relativePrefix = ""
                 } else {
                     searchDir = (repoPath as NSString).appendingPathComponent(parentDir)
+                    relativePrefix = parentDir.hasSuffix("/") ? parentDir : parentDir + "/"
                 }
 
-                let searchURL = URL(fileURLWithPath: searchDir)
-                guard let entries = try? fm.contentsOfDirectory(
-                    at: searchURL,
-                    includingPropertiesForKeys: nil,
-                    options: []
-                ) else { continue }
+                guard let names = try? fm.contentsOfDirectory(atPath: searchDir) else { continue }
 
-                for entry in entries {
-                    let name = entry.lastPathComponent
+                for name in names {
                     if fnmatch(filePattern, name, 0) == 0 {
-                        let relativePath: String
-                        if parentDir.isEmpty || parentDir == "." {
-                            relativePath = name
-                        } else {
-                            relativePath = (parentDir as NSString).appendingPathComponent(name)
-                        }
-                        if !results.contains(relativePath) {
+                        let relativePath = relativePrefix + name
+                        if seen.insert(relativePath).inserted {
                             results.append(relativePath)
                         }
                     }
@@ -54,7 +48,7 @@ public enum FilePatternMatcher {
                 let fullPath = (repoPath as NSString).appendingPathComponent(cleaned)
                 if fm.fileExists(atPath: fullPath) {
                     let entry = pattern.hasSuffix("/") ? cleaned : cleaned
-                    if !results.contains(entry) {
+                    if seen.insert(entry).inserted {
                         results.append(entry)
                     }
                 }
@@ -45,18 +45,19 @@ public enum ScriptCategory: String, Codable, Sendable {
 // MARK: - Analyzer
 
 public enum ProjectAnalyzer {
-    public static func analyze(repoPath: String) -> ProjectScanResult {
-        let repoURL = URL(fileURLWithPath: repoPath)
+    public static func analyze(repoPath: String) async -> ProjectScanResult {
+        let repoURL = URL(filePath: repoPath, directoryHint: .isDirectory)
         let projectName = repoURL.lastPathComponent
 
-        let envFiles = FilePatternMatcher.match(patterns: [".env*"], in: repoPath)
+        // Independent scans run concurrently so the git subprocess overlaps the disk reads;
+        // only script parsing has to wait for the package manager.
+        async let envFiles = FilePatternMatcher.match(patterns: [".env*"], in: repoPath)
+        async let defaultBranch = detectDefaultBranch(repoPath: repoPath)
+        async let existingConfig = readExistingConfig(repoPath: repoPath)
         let packageManager = detectPackageManager(repoPath: repoPath)
         let scripts = parseScripts(repoPath: repoPath, packageManager: packageManager)
-        let defaultBranch = detectDefaultBranch(repoPath: repoPath)
 
-        let existingConfig = readExistingConfig(repoPath: repoPath)
-
-        return ProjectScanResult(
+        return await ProjectScanResult(
             projectName: projectName,
             envFiles: envFiles,
             packageManager: packageManager,
@@ -76,7 +77,11 @@ public enum ProjectAnalyzer {
     }
 
     private static func detectPackageManager(repoPath: String) -> PackageManagerInfo? {
-        let fm = FileManager.default
+        // Candidates are matched against a single listing of the repo root
+        guard let rootEntries = try? FileManager.default.contentsOfDirectory(atPath: repoPath) else {
+            return nil
+        }
+        let names = Set(rootEntries)
 
         // Lock-file-specific checks first (most specific → least)
         let candidates: [PackageManagerCandidate] = [
@@ -96,12 +101,10 @@ public enum ProjectAnalyzer {
         ]
 
         for candidate in candidates {
-            let manifestPath = (repoPath as NSString).appendingPathComponent(candidate.manifestFile)
-            guard fm.fileExists(atPath: manifestPath) else { continue }
+            guard names.contains(candidate.manifestFile) else { continue }
 
             if let lockFile = candidate.lockFile {
-                let lockPath = (repoPath as NSString).appendingPathComponent(lockFile)
-                guard fm.fileExists(atPath: lockPath) else { continue }
+                guard names.contains(lockFile) else { continue }
                 return PackageManagerInfo(
                     name: candidate.name,
                     setupCommand: candidate.setupCommand,
@@ -121,28 +124,34 @@ public enum ProjectAnalyzer {
 
     // MARK: - Script Parsing
 
+    /// Package managers whose scripts live in package.json.
+    private static let jsManagers: Set<String> = ["npm", "yarn", "pnpm", "bun"]
+
+    /// Command prefix used to run a package.json script with each manager.
+    private static let runPrefixes: [String: String] = [
+        "npm": "npm run",
+        "yarn": "yarn",
+        "pnpm": "pnpm run",
+        "bun": "bun run",
+    ]
+
     private static func parseScripts(repoPath: String, packageManager: PackageManagerInfo?) -> [ScriptInfo] {
         guard let pm = packageManager else { return [] }
 
         // Only parse package.json scripts for JS package managers
-        let jsManagers: Set<String> = ["npm", "yarn", "pnpm", "bun"]
         guard jsManagers.contains(pm.name) else { return [] }
 
-        let packageJsonPath = (repoPath as NSString).appendingPathComponent("package.json")
-        guard let data = FileManager.default.contents(atPath: packageJsonPath),
+        let packageJsonURL = URL(filePath: repoPath, directoryHint: .isDirectory)
+            .appending(path: "package.json", directoryHint: .notDirectory)
+        // Skip the full parse when the manifest has no "scripts" key
+        guard let data = try? Data(contentsOf: packageJsonURL, options: .mappedIfSafe),
+              data.range(of: Data(#""scripts""#.utf8)) != nil,
               let json = try? JSONSerialization.jsonObject(with: data) as? [String: Any],
               let scripts = json["scripts"] as? [String: String] else {
             return []
         }
 
-        let runPrefix: String
-        switch pm.name {
-        case "npm": runPrefix = "npm run"
-        case "yarn": runPrefix = "yarn"
-        case "pnpm": runPrefix = "pnpm run"
-        case "bun": runPrefix = "bun run"
-        default: runPrefix = "\(pm.name) run"
-        }
+        let runPrefix = runPrefixes[pm.name] ?? "\(pm.name) run"
 
         return scripts.map { name, command in
             let category = categorizeScript(name: name, command: command)
@@ -161,33 +170,31 @@ public enum ProjectAnalyzer {
         }
     }
 
+    // Category indicators, checked in order: dev server, build, test, lint
+    private static let devNamePatterns = ["dev", "start", "serve", "watch"]
+    private static let devCommandPatterns = ["vite", "next dev", "nodemon", "webpack serve", "webpack-dev-server",
+                                             "ts-node-dev", "tsx watch", "nuxt dev", "remix dev", "astro dev"]
+    private static let buildPatterns = ["build", "compile", "bundle"]
+    private static let testPatterns = ["test", "e2e", "cypress", "vitest", "playwright"]
+    private static let lintPatterns = ["lint", "format", "check", "prettier", "typecheck", "type-check"]
+
     private static func categorizeScript(name: String, command: String) -> ScriptCategory {
         let lowerName = name.lowercased()
-        let lowerCommand = command.lowercased()
 
-        // Dev server indicators
-        let devNamePatterns = ["dev", "start", "serve", "watch"]
-        let devCommandPatterns = ["vite", "next dev", "nodemon", "webpack serve", "webpack-dev-server",
-                                  "ts-node-dev", "tsx watch", "nuxt dev", "remix dev", "astro dev"]
-        if devNamePatterns.contains(where: { lowerName.contains($0) })
-            || devCommandPatterns.contains(where: { lowerCommand.contains($0) }) {
+        if devNamePatterns.contains(where: { lowerName.contains($0) }) {
+            return .devServer
+        }
+        // Only lowercase the command when the name alone didn't decide it
+        let lowerCommand = command.lowercased()
+        if devCommandPatterns.contains(where: { lowerCommand.contains($0) }) {
             return .devServer
         }
-
-        // Build indicators
-        let buildPatterns = ["build", "compile", "bundle"]
         if buildPatterns.contains(where: { lowerName.contains($0) }) {
             return .build
         }
-
-        // Test indicators
-        let testPatterns = ["test", "e2e", "cypress", "vitest", "playwright"]
         if testPatterns.contains(where: { lowerName.contains($0) }) {
             return .test
         }
-
-        // Lint indicators
-        let lintPatterns = ["lint", "format", "check", "prettier", "typecheck", "type-check"]
         if lintPatterns.contains(where: { lowerName.contains($0) }) {
             return .lint
         }
@@ -198,9 +205,24 @@ public enum ProjectAnalyzer {
     // MARK: - Default Branch Detection
 
     private static func detectDefaultBranch(repoPath: String) -> String? {
-        // Try git symbolic-ref for the remote HEAD
-        if let branch = runGit(["symbolic-ref", "--short", "refs/remotes/origin/HEAD"], in: repoPath) {
-            // Returns e.g. "origin/main" — strip the remote prefix
+        // One git invocation covers the remote HEAD and both fallback branches.
+        // Each line is "<refname> <symref target>"; the target is empty for non-symrefs.
+        guard let output = runGit([
+            "for-each-ref", "--format=%(refname) %(symref:short)",
+            "refs/remotes/origin/HEAD", "refs/heads/main", "refs/heads/master",
+        ], in: repoPath) else {
+            return nil
+        }
+
+        var refs: [String: String] = [:]
+        for line in output.split(separator: "\n") {
+            let parts = line.split(separator: " ", maxSplits: 1)
+            guard let refname = parts.first else { continue }
+            refs[String(refname)] = parts.count == 2 ? String(parts[1]) : ""
+        }
+
+        // Prefer the remote HEAD target, e.g. "origin/main" — strip the remote prefix
+        if let branch = refs["refs/remotes/origin/HEAD"], !branch.isEmpty {
             let components = branch.split(separator: "/", maxSplits: 1)
             if components.count == 2 {
                 return String(components[1])
@@ -209,10 +231,8 @@ public enum ProjectAnalyzer {
         }
 
         // Fall back to checking common branch names
-        for name in ["main", "master"] {
-            if runGit(["rev-parse", "--verify", name], in: repoPath) != nil {
-                return name
-            }
+        for name in ["main", "master"] where refs["refs/heads/\(name)"] != nil {
+            return name
         }
 
         return nil
@@ -221,9 +241,9 @@ public enum ProjectAnalyzer {
     // MARK: - Existing Config
 
     private static func readExistingConfig(repoPath: String) -> ProjectConfig? {
-        let url = URL(fileURLWithPath: repoPath)
-            .appendingPathComponent(".wtmux")
-            .appendingPathComponent("config.json")
+        let url = URL(filePath: repoPath, directoryHint: .isDirectory)
+            .appending(path: ".wtmux", directoryHint: .isDirectory)
+            .appending(path: "config.json", directoryHint: .notDirectory)
         guard let data = try? Data(contentsOf: url) else { return nil }
         return try? JSONDecoder().decode(ProjectConfig.self, from: data)
     }
@@ -232,9 +252,9 @@ public enum ProjectAnalyzer {
 
     private static func runGit(_ args: [String], in directory: String) -> String? {
         let process = Process()
-        process.executableURL = URL(fileURLWithPath: "/usr/bin/git")
+        process.executableURL = URL(filePath: "/usr/bin/git", directoryHint: .notDirectory)
         process.arguments = args
-        process.currentDirectoryURL = URL(fileURLWithPath: directory)
+        process.currentDirectoryURL = URL(filePath: directory, directoryHint: .isDirectory)
 
         let pipe = Pipe()
         process.standardOutput = pipe
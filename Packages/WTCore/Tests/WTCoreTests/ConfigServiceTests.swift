@@ -0,0 +1,100 @@
+import Testing
+import Foundation
+@testable import WTCore
+
+@Suite("ConfigService")
+struct ConfigServiceTests {
+    private let fm = FileManager.default
+
+    private func makeTempDir() throws -> String {
+        let dir = NSTemporaryDirectory() + "ConfigServiceTests-\(UUID().uuidString)"
+        try fm.createDirectory(atPath: dir, withIntermediateDirectories: true)
+        return dir
+    }
+
+    private func gitignorePath(in dir: String) -> String {
+        (dir as NSString).appendingPathComponent(".gitignore")
+    }
+
+    private func writeGitignore(_ contents: String, in dir: String) throws {
+        try contents.write(toFile: gitignorePath(in: dir), atomically: true, encoding: .utf8)
+    }
+
+    private func readGitignore(in dir: String) throws -> String {
+        try String(contentsOfFile: gitignorePath(in: dir), encoding: .utf8)
+    }
+
+    // MARK: - ensureGitignore
+
+    @Test("Creates .gitignore when none exists")
+    func createsMissingGitignore() async throws {
+        let dir = try makeTempDir()
+        defer { try? fm.removeItem(atPath: dir) }
+
+        let added = try await ConfigService().ensureGitignore(forRepo: dir)
+        #expect(added)
+        #expect(try readGitignore(in: dir) == "\n.wtmux\n")
+    }
+
+    @Test("Appends to an empty .gitignore")
+    func appendsToEmptyFile() async throws {
+        let dir = try makeTempDir()
+        defer { try? fm.removeItem(atPath: dir) }
+
+        try writeGitignore("", in: dir)
+
+        let added = try await ConfigService().ensureGitignore(forRepo: dir)
+        #expect(added)
+        #expect(try readGitignore(in: dir) == "\n.wtmux\n")
+    }
+
+    @Test("Appends after existing entries ending in a newline")
+    func appendsAfterTrailingNewline() async throws {
+        let dir = try makeTempDir()
+        defer { try? fm.removeItem(atPath: dir) }
+
+        try writeGitignore("node_modules\n", in: dir)
+
+        let added = try await ConfigService().ensureGitignore(forRepo: dir)
+        #expect(added)
+        #expect(try readGitignore(in: dir) == "node_modules\n.wtmux\n")
+    }
+
+    @Test("Inserts a newline before appending when the file lacks one")
+    func appendsWithoutTrailingNewline() async throws {
+        let dir = try makeTempDir()
+        defer { try? fm.removeItem(atPath: dir) }
+
+        try writeGitignore("node_modules", in: dir)
+
+        let added = try await ConfigService().ensureGitignore(forRepo: dir)
+        #expect(added)
+        #expect(try readGitignore(in: dir) == "node_modules\n.wtmux\n")
+    }
+
+    @Test("Leaves the file unchanged when .wtmux is already listed",
+          arguments: [".wtmux", ".wtmux/", "  .wtmux  ", "\t.wtmux/ "])
+    func existingEntryIsKept(entry: String) async throws {
+        let dir = try makeTempDir()
+        defer { try? fm.removeItem(atPath: dir) }
+
+        let original = "node_modules\n\(entry)\ndist\n"
+        try writeGitignore(original, in: dir)
+
+        let added = try await ConfigService().ensureGitignore(forRepo: dir)
+        #expect(!added)
+        #expect(try readGitignore(in: dir) == original)
+    }
+
+    @Test("Appends when .wtmux only appears inside another entry")
+    func substringMatchStillAppends() async throws {
+        let dir = try makeTempDir()
+        defer { try? fm.removeItem(atPath: dir) }
+
+        try writeGitignore("foo.wtmux\n", in: dir)
+
+        let added = try await ConfigService().ensureGitignore(forRepo: dir)
+        #expect(added)
+        #expect(try readGitignore(in: dir) == "foo.wtmux\n.wtmux\n")
+    }
+}
@@ -0,0 +1,146 @@
+import Testing
+import Foundation
+@testable import WTCore
+
+@Suite("ProjectAnalyzer")
+struct ProjectAnalyzerTests {
+    private let fm = FileManager.default
+
+    private struct GitError: Error {
+        let args: [String]
+    }
+
+    private func makeTempDir() throws -> String {
+        let dir = NSTemporaryDirectory() + "ProjectAnalyzerTests-\(UUID().uuidString)"
+        try fm.createDirectory(atPath: dir, withIntermediateDirectories: true)
+        return dir
+    }
+
+    private func git(_ args: [String], in dir: String) throws {
+        let process = Process()
+        process.executableURL = URL(filePath: "/usr/bin/git", directoryHint: .notDirectory)
+        // Pin identity and signing so fixtures don't depend on the host's git config
+        process.arguments = [
+            "-c", "user.name=WTMux Tests",
+            "-c", "user.email=tests@wtmux.invalid",
+            "-c", "commit.gpgsign=false",
+        ] + args
+        process.currentDirectoryURL = URL(filePath: dir, directoryHint: .isDirectory)
+        process.standardOutput = FileHandle.nullDevice
+        process.standardError = FileHandle.nullDevice
+        try process.run()
+        process.waitUntilExit()
+        guard process.terminationStatus == 0 else { throw GitError(args: args) }
+    }
+
+    /// Creates a repo whose only local branch is `branch`, with one empty commit.
+    private func makeRepo(branch: String) throws -> String {
+        let dir = try makeTempDir()
+        try git(["init", "--quiet"], in: dir)
+        try git(["symbolic-ref", "HEAD", "refs/heads/\(branch)"], in: dir)
+        try git(["commit", "--quiet", "--allow-empty", "--no-verify", "-m", "Initial commit"], in: dir)
+        return dir
+    }
+
+    private func createFile(_ name: String, contents: String, in dir: String) throws {
+        try contents.write(toFile: (dir as NSString).appendingPathComponent(name), atomically: true, encoding: .utf8)
+    }
+
+    // MARK: - Script Parsing
+
+    @Test("Returns no scripts when package.json has no scripts key")
+    func scriptsMissingFromPackageJson() async throws {
+        let dir = try makeTempDir()
+        defer { try? fm.removeItem(atPath: dir) }
+
+        try createFile("package.json", contents: #"{"name": "app", "dependencies": {"vite": "^5.0.0"}}"#, in: dir)
+
+        let result = await ProjectAnalyzer.analyze(repoPath: dir)
+        #expect(result.packageManager?.name == "npm")
+        #expect(result.scripts.isEmpty)
+    }
+
+    @Test("Parses, categorizes and sorts package.json scripts")
+    func scriptsParsedFromPackageJson() async throws {
+        let dir = try makeTempDir()
+        defer { try? fm.removeItem(atPath: dir) }
+
+        try createFile("package.json", contents: """
+            {
+              "name": "app",
+              "scripts": {
+                "postinstall": "node scripts/setup.js",
+                "lint": "eslint .",
+                "test": "jest",
+                "build": "tsc -b",
+                "dev": "vite",
+                "app": "next dev"
+              }
+            }
+            """, in: dir)
+        try createFile("yarn.lock", contents: "", in: dir)
+
+        let result = await ProjectAnalyzer.analyze(repoPath: dir)
+        #expect(result.packageManager?.name == "yarn")
+        #expect(result.scripts.map(\.name) == ["app", "dev", "build", "test", "lint", "postinstall"])
+        #expect(result.scripts.map(\.category) == [.devServer, .devServer, .build, .test, .lint, .other])
+        #expect(result.scripts.map(\.runCommand) == [
+            "yarn app", "yarn dev", "yarn build", "yarn test", "yarn lint", "yarn postinstall",
+        ])
+        #expect(result.scripts.first?.command == "next dev")
+    }
+
+    // MARK: - Default Branch Detection
+
+    @Test("Uses origin/HEAD's target when it is a symref")
+    func defaultBranchFromOriginHead() async throws {
+        let dir = try makeRepo(branch: "main")
+        defer { try? fm.removeItem(atPath: dir) }
+
+        try git(["update-ref", "refs/remotes/origin/develop", "HEAD"], in: dir)
+        try git(["symbolic-ref", "refs/remotes/origin/HEAD", "refs/remotes/origin/develop"], in: dir)
+
+        let result = await ProjectAnalyzer.analyze(repoPath: dir)
+        #expect(result.defaultBranch == "develop")
+    }
+
+    @Test("Falls back to main without origin/HEAD")
+    func defaultBranchFallsBackToMain() async throws {
+        let dir = try makeRepo(branch: "main")
+        defer { try? fm.removeItem(atPath: dir) }
+
+        try git(["branch", "master"], in: dir)
+
+        let result = await ProjectAnalyzer.analyze(repoPath: dir)
+        #expect(result.defaultBranch == "main")
+    }
+
+    @Test("Falls back to master when it is the only candidate")
+    func defaultBranchFallsBackToMaster() async throws {
+        let dir = try makeRepo(branch: "master")
+        defer { try? fm.removeItem(atPath: dir) }
+
+        let result = await ProjectAnalyzer.analyze(repoPath: dir)
+        #expect(result.defaultBranch == "master")
+    }
+
+    @Test("Ignores an origin/HEAD that points at a deleted ref")
+    func defaultBranchIgnoresDanglingOriginHead() async throws {
+        let dir = try makeRepo(branch: "main")
+        defer { try? fm.removeItem(atPath: dir) }
+
+        try git(["symbolic-ref", "refs/remotes/origin/HEAD", "refs/remotes/origin/gone"], in: dir)
+
+        let result = await ProjectAnalyzer.analyze(repoPath: dir)
+        #expect(result.defaultBranch == "main")
+    }
+
+    @Test("Returns nil when none of the refs exist")
+    func defaultBranchMissing() async throws {
+        let dir = try makeRepo(branch: "trunk")
+        defer { try? fm.removeItem(atPath: dir) }
+
+        let result = await ProjectAnalyzer.analyze(repoPath: dir)
+        #expect(result.defaultBranch == nil)
+    }
+}
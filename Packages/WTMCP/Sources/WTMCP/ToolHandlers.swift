@@ -23,8 +23,8 @@ struct ToolHandlers: Sendable {
     private let configService = ConfigService()
 
     func register(on server: Server) async {
-        await server.withMethodHandler(ListTools.self) { [self] _ in
-            ListTools.Result(tools: self.toolDefinitions)
+        await server.withMethodHandler(ListTools.self) { _ in
+            ListTools.Result(tools: Self.toolDefinitions)
         }
 
         await server.withMethodHandler(CallTool.self) { [self] params in
@@ -34,11 +34,12 @@ struct ToolHandlers: Sendable {
 
     // MARK: - Tool Definitions
 
-    private var toolDefinitions: [Tool] {
-        [analyzeProjectTool, configureProjectTool, getProjectConfigTool]
-    }
+    /// Built once; the definitions are static and tools/list may be called repeatedly.
+    private static let toolDefinitions: [Tool] = [
+        analyzeProjectTool, configureProjectTool, getProjectConfigTool,
+    ]
 
-    private var configureProjectTool: Tool {
+    private static var configureProjectTool: Tool {
         Tool(
             name: "configure_project",
             description: """
@@ -149,7 +150,7 @@ struct ToolHandlers: Sendable {
         )
     }
 
-    private var getProjectConfigTool: Tool {
+    private static var getProjectConfigTool: Tool {
         Tool(
             name: "get_project_config",
             description: """
@@ -170,7 +171,7 @@ struct ToolHandlers: Sendable {
         )
     }
 
-    private var analyzeProjectTool: Tool {
+    private static var analyzeProjectTool: Tool {
         Tool(
             name: "analyze_project",
             description: """
@@ -196,7 +197,7 @@ struct ToolHandlers: Sendable {
     private func handleCall(_ params: CallTool.Parameters) async -> CallTool.Result {
         switch params.name {
         case "analyze_project":
-            return handleAnalyzeProject(params.arguments)
+            return await handleAnalyzeProject(params.arguments)
         case "configure_project":
             return await handleConfigureProject(params.arguments)
         case "get_project_config":
@@ -211,7 +212,7 @@ struct ToolHandlers: Sendable {
 
     // MARK: - analyze_project
 
-    private func handleAnalyzeProject(_ arguments: [String: Value]?) -> CallTool.Result {
+    private func handleAnalyzeProject(_ arguments: [String: Value]?) async -> CallTool.Result {
         guard let repoPath = arguments?["repoPath"]?.stringValue else {
             return .init(content: [.text("Missing required parameter: repoPath")], isError: true)
         }
@@ -220,7 +221,7 @@ struct ToolHandlers: Sendable {
             return .init(content: [.text("repoPath must be an absolute path")], isError: true)
         }
 
-        let gitDir = URL(fileURLWithPath: repoPath).appendingPathComponent(".git")
+        let gitDir = URL(filePath: repoPath, directoryHint: .isDirectory).appending(path: ".git")
         guard FileManager.default.fileExists(atPath: gitDir.path) else {
             return .init(
                 content: [.text("No .git directory found at \(repoPath). Is this a git repository?")],
@@ -228,7 +229,7 @@ struct ToolHandlers: Sendable {
             )
         }
 
-        let analysis = ProjectAnalyzer.analyze(repoPath: repoPath)
+        let analysis = await ProjectAnalyzer.analyze(repoPath: repoPath)
 
         let encoder = JSONEncoder()
         encoder.outputFormatting = [.prettyPrinted, .sortedKeys]
@@ -252,7 +253,7 @@ struct ToolHandlers: Sendable {
             return .init(content: [.text("repoPath must be an absolute path")], isError: true)
         }
 
-        let gitDir = URL(fileURLWithPath: repoPath).appendingPathComponent(".git")
+        let gitDir = URL(filePath: repoPath, directoryHint: .isDirectory).appending(path: ".git")
         guard FileManager.default.fileExists(atPath: gitDir.path) else {
             return .init(
                 content: [.text("No .git directory found at \(repoPath). Is this a git repository?")],